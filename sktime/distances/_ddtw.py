@@ -1,6 +1,6 @@
 __author__ = ["chrisholder", "TonyBagnall"]
 
-
+from functools import lru_cache
 from typing import Any, Callable, List, Tuple
 
 import numpy as np
@@ -36,6 +36,152 @@ def average_of_slope_transform(X: np.ndarray) -> np.ndarray:
     return np.array(derivative_X)
 
 
+def _panel_derivative(
+    X: np.ndarray, compute_derivative: DerivativeCallable
+) -> np.ndarray:
+    """Compute the derivative of every series of a panel.
+
+    Parameters
+    ----------
+    X: np.ndarray (3d array of shape (n, d, m))
+        Panel of time series. Integer panels are converted to float first.
+    compute_derivative: Callable[[np.ndarray], np.ndarray]
+        No_python compiled callable that computes the derivative.
+
+    Returns
+    -------
+    np.ndarray (3d array of shape (n, d, m'))
+        The derivative of every series of X.
+    """
+    if not np.issubdtype(X.dtype, np.floating):
+        X = X.astype(float)
+    return np.ascontiguousarray([compute_derivative(series) for series in X])
+
+
+def _numba_ddtw_distance(
+    _bounding_matrix: np.ndarray,
+    compute_derivative: DerivativeCallable,
+) -> DistanceCallable:
+    """Compile the ddtw distance callable for a resolved bounding matrix.
+
+    Parameters
+    ----------
+    _bounding_matrix: np.ndarray (2d array of shape (m1,m2))
+        Bounding matrix where the index in bound finite values (0.) and indexes
+        outside bound points are infinite values (non finite).
+    compute_derivative: Callable[[np.ndarray], np.ndarray]
+        No_python compiled callable that computes the derivative.
+
+    Returns
+    -------
+    Callable[[np.ndarray, np.ndarray], float]
+        No_python compiled ddtw distance callable.
+    """
+    from sktime.distances._dtw_numba import _cost_matrix
+    from sktime.utils.numba.njit import njit
+
+    @njit(cache=True)
+    def numba_ddtw_distance(_x: np.ndarray, _y: np.ndarray) -> float:
+        _x = compute_derivative(_x)
+        _y = compute_derivative(_y)
+        cost_matrix = _cost_matrix(_x, _y, _bounding_matrix)
+        return cost_matrix[-1, -1]
+
+    return numba_ddtw_distance
+
+
+def _numba_ddtw_distance_bounds(
+    _lower_bounds: np.ndarray,
+    _upper_bounds: np.ndarray,
+    compute_derivative: DerivativeCallable,
+) -> DistanceCallable:
+    """Compile the ddtw distance callable for a window given as per row bounds.
+
+    Used for a Sakoe-Chiba window and for no window. Only the cells inside the
+    bounds are visited, and only two rows of the cost matrix are kept.
+
+    Parameters
+    ----------
+    _lower_bounds: np.ndarray (1d array of size m1)
+        First in bound index of the second series for each index of the first.
+    _upper_bounds: np.ndarray (1d array of size m1)
+        Last in bound index of the second series for each index of the first.
+    compute_derivative: Callable[[np.ndarray], np.ndarray]
+        No_python compiled callable that computes the derivative.
+
+    Returns
+    -------
+    Callable[[np.ndarray, np.ndarray], float]
+        No_python compiled ddtw distance callable.
+    """
+    from sktime.distances._ddtw_numba import _ddtw_bounded_distance, average_of_slope
+    from sktime.distances._dtw_numba import _bounded_dtw_distance
+    from sktime.utils.numba.njit import njit
+
+    # the default derivative is evaluated inside the dtw, without materialising
+    # the derivative of x
+    _fuse_derivative = compute_derivative is average_of_slope
+
+    @njit(cache=True)
+    def numba_ddtw_distance(_x: np.ndarray, _y: np.ndarray) -> float:
+        if _fuse_derivative:
+            return _ddtw_bounded_distance(_x, _y, _lower_bounds, _upper_bounds)
+        _x = compute_derivative(_x)
+        _y = compute_derivative(_y)
+        return _bounded_dtw_distance(_x, _y, _lower_bounds, _upper_bounds)
+
+    return numba_ddtw_distance
+
+
+@lru_cache(maxsize=128)
+def _cached_numba_ddtw_distance(
+    x_size: int,
+    y_size: int,
+    window: float,
+    itakura_max_slope: float,
+    compute_derivative: DerivativeCallable,
+) -> DistanceCallable:
+    """Return the ddtw distance callable, compiling it once per set of parameters.
+
+    Parameters
+    ----------
+    x_size: int
+        Number of timepoints of the first time series.
+    y_size: int
+        Number of timepoints of the second time series.
+    window: float or None
+        Float that is the radius of the Sakoe-Chiba window.
+    itakura_max_slope: float or None
+        Gradient of the slope for Itakura parallelogram.
+    compute_derivative: Callable[[np.ndarray], np.ndarray]
+        No_python compiled callable that computes the derivative.
+
+    Returns
+    -------
+    Callable[[np.ndarray, np.ndarray], float]
+        No_python compiled ddtw distance callable.
+    """
+    from sktime.distances._lower_bounding_numba import (
+        no_bounding_bounds,
+        sakoe_chiba_bounds,
+    )
+    from sktime.distances.lower_bounding import resolve_bounding_matrix
+
+    if itakura_max_slope is None:
+        if window is None:
+            _lower_bounds, _upper_bounds = no_bounding_bounds(x_size, y_size)
+        else:
+            _lower_bounds, _upper_bounds = sakoe_chiba_bounds(x_size, y_size, window)
+        return _numba_ddtw_distance_bounds(
+            _lower_bounds, _upper_bounds, compute_derivative
+        )
+
+    _bounding_matrix = resolve_bounding_matrix(
+        np.zeros((1, x_size)), np.zeros((1, y_size)), window, itakura_max_slope
+    )
+    return _numba_ddtw_distance(_bounding_matrix, compute_derivative)
+
+
 class _DdtwDistance(NumbaDistance):
     """Derivative dynamic time warping (ddtw) between two time series.
 
@@ -202,19 +348,110 @@ class _DdtwDistance(NumbaDistance):
             If the itakura_max_slope is not a float or int.
             If the compute derivative callable is not no_python compiled.
         """
-        from sktime.distances._dtw_numba import _cost_matrix
         from sktime.distances._numba_utils import is_no_python_compiled_callable
         from sktime.distances.lower_bounding import resolve_bounding_matrix
-        from sktime.utils.numba.njit import njit
 
         if compute_derivative is None:
             from sktime.distances._ddtw_numba import average_of_slope
 
             compute_derivative = average_of_slope
 
+        if not is_no_python_compiled_callable(compute_derivative):
+            raise TypeError(
+                f"The derivative callable must be no_python compiled. The name"
+                f"of the callable that must be compiled is "
+                f"{compute_derivative.__name__}"
+            )
+
+        # without a custom bounding matrix the compiled callable only depends on
+        # hashable parameters, so it can be reused instead of being recompiled
+        if (
+            bounding_matrix is None
+            and (window is None or isinstance(window, float))
+            and (itakura_max_slope is None or isinstance(itakura_max_slope, float))
+        ):
+            return _cached_numba_ddtw_distance(
+                x.shape[1], y.shape[1], window, itakura_max_slope, compute_derivative
+            )
+
         _bounding_matrix = resolve_bounding_matrix(
             x, y, window, itakura_max_slope, bounding_matrix
         )
+        return _numba_ddtw_distance(_bounding_matrix, compute_derivative)
+
+    def pairwise_distance_factory(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        window: float = None,
+        itakura_max_slope: float = None,
+        bounding_matrix: np.ndarray = None,
+        compute_derivative=None,
+        **kwargs: Any,
+    ) -> Callable[[np.ndarray, np.ndarray, bool], np.ndarray]:
+        """Create a ddtw pairwise distance callable.
+
+        The derivative of every series is computed once per panel, instead of once
+        per pair of series, and the pairs are computed in parallel by a compiled
+        kernel that is shared by all calls.
+
+        Panels should be shape (n, d, m), where n is the number of instances, d the
+        number of dimensions and m the series length.
+
+        Parameters
+        ----------
+        x: np.ndarray (3d array of shape (n1,d,m1)).
+            First panel of time series.
+        y: np.ndarray (3d array of shape (n2,d,m2)).
+            Second panel of time series.
+        window: float, defaults = None
+            Float that is the radius of the Sakoe-Chiba window (if using Sakoe-Chiba
+            lower bounding). Must be between 0 and 1.
+        itakura_max_slope: float, defaults = None
+            Gradient of the slope for Itakura parallelogram (if using Itakura
+            Parallelogram lower bounding). Must be between 0 and 1.
+        bounding_matrix: np.ndarray (2d array of shape (m1,m2)), defaults = None
+            Custom bounding matrix to use. If defined then other lower_bounding params
+            are ignored. The matrix should be structure so that indexes considered in
+            bound should be the value 0. and indexes outside the bounding matrix should
+            be infinity.
+        compute_derivative: Callable[[np.ndarray], np.ndarray],
+                                defaults = average slope difference
+            Callable that computes the derivative. If none is provided the average of
+            the slope between two points used.
+        kwargs: any
+            extra kwargs.
+
+        Returns
+        -------
+        Callable[[np.ndarray, np.ndarray, bool], np.ndarray]
+            Callable taking two 3d panels and a boolean that is True when both
+            panels are the same, returning the 2d pairwise ddtw distance matrix.
+
+        Raises
+        ------
+        ValueError
+            If the window is not between 0 and 1.
+            If the itakura_max_slope is not a float or int.
+            If both window and itakura_max_slope are set.
+        TypeError
+            If the compute derivative callable is not no_python compiled.
+        """
+        from sktime.distances._dtw_numba import (
+            _bounded_dtw_pairwise_distance,
+            _dtw_pairwise_distance,
+        )
+        from sktime.distances._lower_bounding_numba import (
+            no_bounding_bounds,
+            sakoe_chiba_bounds,
+        )
+        from sktime.distances._numba_utils import is_no_python_compiled_callable
+        from sktime.distances.lower_bounding import resolve_bounding_matrix
+
+        if compute_derivative is None:
+            from sktime.distances._ddtw_numba import average_of_slope
+
+            compute_derivative = average_of_slope
 
         if not is_no_python_compiled_callable(compute_derivative):
             raise TypeError(
@@ -223,14 +460,34 @@ class _DdtwDistance(NumbaDistance):
                 f"{compute_derivative.__name__}"
             )
 
-        @njit(cache=True)
-        def numba_ddtw_distance(
-            _x: np.ndarray,
-            _y: np.ndarray,
-        ) -> float:
-            _x = compute_derivative(_x)
-            _y = compute_derivative(_y)
-            cost_matrix = _cost_matrix(_x, _y, _bounding_matrix)
-            return cost_matrix[-1, -1]
-
-        return numba_ddtw_distance
+        # the kernels are module level, so they are compiled once per type
+        # signature and only the window is resolved per call
+        if (
+            bounding_matrix is None
+            and itakura_max_slope is None
+            and (window is None or isinstance(window, float))
+        ):
+            if window is None:
+                _window = no_bounding_bounds(x.shape[-1], y.shape[-1])
+            else:
+                _window = sakoe_chiba_bounds(x.shape[-1], y.shape[-1], window)
+            _pairwise_kernel = _bounded_dtw_pairwise_distance
+        else:
+            _window = (
+                resolve_bounding_matrix(
+                    x[0], y[0], window, itakura_max_slope, bounding_matrix
+                ),
+            )
+            _pairwise_kernel = _dtw_pairwise_distance
+
+        def ddtw_pairwise_distance(
+            _x: np.ndarray, _y: np.ndarray, symmetric: bool
+        ) -> np.ndarray:
+            x_derivatives = _panel_derivative(_x, compute_derivative)
+            if symmetric:
+                y_derivatives = x_derivatives
+            else:
+                y_derivatives = _panel_derivative(_y, compute_derivative)
+            return _pairwise_kernel(x_derivatives, y_derivatives, *_window, symmetric)
+
+        return ddtw_pairwise_distance
@@ -4,10 +4,11 @@ __author__ = ["chrisholder", "TonyBagnall"]
 
 import numpy as np
 
+from sktime.distances._dtw_numba import _dtw_row
 from sktime.utils.numba.njit import njit
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True)
 def average_of_slope(q: np.ndarray) -> np.ndarray:
     r"""Compute the average of a slope between points.
 
@@ -36,7 +37,72 @@ def average_of_slope(q: np.ndarray) -> np.ndarray:
     .. [1] Keogh E, Pazzani M Derivative dynamic time warping. In: proceedings of 1st
     SIAM International Conference on Data Mining, 2001
     """
-    q = q.transpose()
-    q2 = 0.25 * q[2:] + 0.5 * q[1:-1] - 0.75 * q[:-2]
-    q2 = q2.transpose()
+    n_dims, n_timepoints = q.shape
+    n_derivatives = max(n_timepoints - 2, 0)
+    # integer series are promoted to float by the arithmetic, floats keep their dtype
+    q2 = np.empty((n_dims, n_derivatives), dtype=(q[:, :0] * 0.25).dtype)
+    for i in range(n_dims):
+        for j in range(n_derivatives):
+            q2[i, j] = 0.25 * q[i, j + 2] + 0.5 * q[i, j + 1] - 0.75 * q[i, j]
     return q2
+
+
+@njit(cache=True)
+def _ddtw_bounded_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+) -> float:
+    """Ddtw distance using the average of slope derivative, fused into the dtw.
+
+    Equivalent to _bounded_dtw_distance on the average_of_slope derivatives of x and
+    y, but the derivative of x is evaluated row by row inside the cost computation
+    instead of being materialised.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape dxm1).
+        First time series.
+    y: np.ndarray (2d array of shape dxm2).
+        Second time series.
+    lower_bounds: np.ndarray (1d array of size at least m1 - 2)
+        First in bound index of the derivative of y for each index of the
+        derivative of x.
+    upper_bounds: np.ndarray (1d array of size at least m1 - 2)
+        Last in bound index of the derivative of y for each index of the derivative
+        of x. Indexes beyond the length of the derivative of y are ignored.
+
+    Returns
+    -------
+    float
+        Ddtw distance between x and y.
+    """
+    dimensions = x.shape[0]
+    x_size = max(x.shape[1] - 2, 0)
+    y_size = max(y.shape[1] - 2, 0)
+
+    # the derivative of y is read by every row, so it is computed once
+    y_derivative = average_of_slope(y)
+    x_derivative = np.empty(dimensions, dtype=x.dtype)
+
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+    prev_start = -1
+    prev_end = 0
+
+    for i in range(x_size):
+        for k in range(dimensions):
+            x_derivative[k] = 0.25 * x[k, i + 2] + 0.5 * x[k, i + 1] - 0.75 * x[k, i]
+
+        start = lower_bounds[i]
+        end = min(upper_bounds[i] + 1, y_size)
+        _dtw_row(x_derivative, y_derivative, prev_row, curr_row, start, end)
+
+        prev_row[prev_start + 1 : prev_end + 1] = np.inf
+        prev_row, curr_row = curr_row, prev_row
+        prev_start = start
+        prev_end = end
+
+    return prev_row[y_size]
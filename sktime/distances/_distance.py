@@ -2147,6 +2147,16 @@ def pairwise_distance(
         y = x
     _y = _make_3d_series(y)
     symmetric = np.array_equal(_x, _y)
+    # ddtw derives every series once per panel rather than once per pair, factory
+    # callables are left to _resolve_metric_to_factory so they are only called once
+    _dist_instance = None
+    if isinstance(metric, (str, NumbaDistance)) or metric is ddtw_distance:
+        _dist_instance = _resolve_dist_instance(
+            metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
+        )
+    if type(_dist_instance) is _DdtwDistance:
+        _pairwise_callable = _dist_instance.pairwise_distance_factory(_x, _y, **kwargs)
+        return _pairwise_callable(_x, _y, symmetric)
     _metric_callable = _resolve_metric_to_factory(
         metric, _x[0], _y[0], _METRIC_INFOS, **kwargs
     )
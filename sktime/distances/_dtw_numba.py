@@ -10,6 +10,7 @@ from sktime.utils.dependencies import _check_soft_dependencies
 from sktime.utils.numba.njit import njit
 
 if _check_soft_dependencies("numba", severity="none"):
+    from numba import prange
     from numba.core.errors import NumbaWarning
 
     # Warning occurs when using large time series (i.e. 1000x1000)
@@ -60,3 +61,230 @@ def _cost_matrix(
                 )
 
     return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _bounded_cost_matrix(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+) -> np.ndarray:
+    """Dtw cost matrix for a window given as per row index bounds.
+
+    Equivalent to _cost_matrix with the matching bounding matrix, but only the
+    columns in bound of each row are visited and no bounding matrix is read.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape dxm1).
+        First time series.
+    y: np.ndarray (2d array of shape dxm2).
+        Second time series.
+    lower_bounds: np.ndarray (1d array of size at least m1)
+        First in bound index of y for each index of x.
+    upper_bounds: np.ndarray (1d array of size at least m1)
+        Last in bound index of y for each index of x. Indexes beyond the length of
+        y are ignored.
+
+    Returns
+    -------
+    cost_matrix: np.ndarray (of shape (n, m) where n is the len(x) and m is len(y))
+        The dtw cost matrix.
+    """
+    dimensions = x.shape[0]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    cost_matrix = np.full((x_size + 1, y_size + 1), np.inf)
+    cost_matrix[0, 0] = 0.0
+
+    for i in range(x_size):
+        for j in range(lower_bounds[i], min(upper_bounds[i] + 1, y_size)):
+            sum = 0
+            for k in range(dimensions):
+                sum += (x[k][i] - y[k][j]) ** 2
+            cost_matrix[i + 1, j + 1] = sum
+            cost_matrix[i + 1, j + 1] += min(
+                cost_matrix[i, j + 1], cost_matrix[i + 1, j], cost_matrix[i, j]
+            )
+
+    return cost_matrix[1:, 1:]
+
+
+@njit(cache=True)
+def _dtw_row(
+    x_point: np.ndarray,
+    y: np.ndarray,
+    prev_row: np.ndarray,
+    curr_row: np.ndarray,
+    start: int,
+    end: int,
+) -> None:
+    """Fill the in bound cells of one row of a two row dtw cost matrix.
+
+    The rows are shifted by one, so that index 0 is the column before the start of
+    y. Cells outside of [start, end) are left untouched and must be infinite.
+
+    Parameters
+    ----------
+    x_point: np.ndarray (1d array of size d)
+        Point of the first time series the row belongs to.
+    y: np.ndarray (2d array of shape dxm2).
+        Second time series.
+    prev_row: np.ndarray (1d array of size m2 + 1)
+        Previous row of the cost matrix.
+    curr_row: np.ndarray (1d array of size m2 + 1)
+        Row of the cost matrix to fill.
+    start: int
+        First in bound index of y.
+    end: int
+        Index of y after the last in bound index.
+    """
+    for j in range(start, end):
+        sum = 0
+        for k in range(x_point.shape[0]):
+            sum += (x_point[k] - y[k][j]) ** 2
+        curr_row[j + 1] = sum + min(prev_row[j + 1], curr_row[j], prev_row[j])
+
+
+@njit(cache=True)
+def _bounded_dtw_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+) -> float:
+    """Dtw distance for a window given as per row index bounds.
+
+    Equivalent to the last value of _bounded_cost_matrix, but only two rows of the
+    cost matrix are kept in memory.
+
+    Parameters
+    ----------
+    x: np.ndarray (2d array of shape dxm1).
+        First time series.
+    y: np.ndarray (2d array of shape dxm2).
+        Second time series.
+    lower_bounds: np.ndarray (1d array of size at least m1)
+        First in bound index of y for each index of x.
+    upper_bounds: np.ndarray (1d array of size at least m1)
+        Last in bound index of y for each index of x. Indexes beyond the length of
+        y are ignored.
+
+    Returns
+    -------
+    float
+        Dtw distance between x and y.
+    """
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+    prev_start = -1
+    prev_end = 0
+
+    for i in range(x_size):
+        start = lower_bounds[i]
+        end = min(upper_bounds[i] + 1, y_size)
+        _dtw_row(x[:, i], y, prev_row, curr_row, start, end)
+
+        # the previous row is not needed anymore, reset the cells it wrote so the
+        # buffer can be reused for the next row
+        prev_row[prev_start + 1 : prev_end + 1] = np.inf
+        prev_row, curr_row = curr_row, prev_row
+        prev_start = start
+        prev_end = end
+
+    return prev_row[y_size]
+
+
+@njit(cache=True, parallel=True)
+def _bounded_dtw_pairwise_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    symmetric: bool,
+) -> np.ndarray:
+    """Pairwise dtw distance between two panels for per row index bounds.
+
+    Parameters
+    ----------
+    x: np.ndarray (3d array of shape (n1,d,m1)).
+        First panel of time series.
+    y: np.ndarray (3d array of shape (n2,d,m2)).
+        Second panel of time series.
+    lower_bounds: np.ndarray (1d array of size at least m1)
+        First in bound index of y for each index of x.
+    upper_bounds: np.ndarray (1d array of size at least m1)
+        Last in bound index of y for each index of x.
+    symmetric: bool
+        True if x and y are the same panel, then only the upper triangle is
+        computed and mirrored.
+
+    Returns
+    -------
+    np.ndarray (2d array of shape (n1,n2))
+        Pairwise dtw distance matrix between x and y.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    pairwise_matrix = np.zeros((x_size, y_size))
+
+    for i in prange(x_size):
+        j_start = i if symmetric else 0
+        for j in range(j_start, y_size):
+            pairwise_matrix[i, j] = _bounded_dtw_distance(
+                x[i], y[j], lower_bounds, upper_bounds
+            )
+
+    if symmetric:
+        for i in range(x_size):
+            for j in range(i):
+                pairwise_matrix[i, j] = pairwise_matrix[j, i]
+    return pairwise_matrix
+
+
+@njit(cache=True, parallel=True)
+def _dtw_pairwise_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounding_matrix: np.ndarray,
+    symmetric: bool,
+) -> np.ndarray:
+    """Pairwise dtw distance between two panels for a bounding matrix.
+
+    Parameters
+    ----------
+    x: np.ndarray (3d array of shape (n1,d,m1)).
+        First panel of time series.
+    y: np.ndarray (3d array of shape (n2,d,m2)).
+        Second panel of time series.
+    bounding_matrix: np.ndarray (2d array of shape m1xm2)
+        Bounding matrix where the index in bound finite values (0.) and indexes
+        outside bound points are infinite values (non finite).
+    symmetric: bool
+        True if x and y are the same panel, then only the upper triangle is
+        computed and mirrored.
+
+    Returns
+    -------
+    np.ndarray (2d array of shape (n1,n2))
+        Pairwise dtw distance matrix between x and y.
+    """
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    pairwise_matrix = np.zeros((x_size, y_size))
+
+    for i in prange(x_size):
+        j_start = i if symmetric else 0
+        for j in range(j_start, y_size):
+            pairwise_matrix[i, j] = _cost_matrix(x[i], y[j], bounding_matrix)[-1, -1]
+
+    if symmetric:
+        for i in range(x_size):
+            for j in range(i):
+                pairwise_matrix[i, j] = pairwise_matrix[j, i]
+    return pairwise_matrix
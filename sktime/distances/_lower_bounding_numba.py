@@ -3,7 +3,7 @@
 __author__ = ["chrisholder", "TonyBagnall"]
 
 import math
-from typing import Union
+from typing import Tuple, Union
 
 import numpy as np
 
@@ -114,6 +114,32 @@ def no_bounding(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     return np.zeros((x.shape[1], y.shape[1]))
 
 
+@njit(cache=True)
+def no_bounding_bounds(x_size: int, y_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Create per row index bounds with no bounding.
+
+    This is the same window as created by no_bounding, stored as the first and
+    last in bound column of every row, see sakoe_chiba_bounds.
+
+    Parameters
+    ----------
+    x_size: int
+        Number of timepoints of the first time series.
+    y_size: int
+        Number of timepoints of the second time series.
+
+    Returns
+    -------
+    np.ndarray (1d array of size x_size)
+        First in bound column index of each row, always 0.
+    np.ndarray (1d array of size x_size)
+        Last in bound column index of each row, always y_size - 1.
+    """
+    lower_bounds = np.zeros(x_size, dtype=np.int64)
+    upper_bounds = np.full(x_size, y_size - 1, dtype=np.int64)
+    return lower_bounds, upper_bounds
+
+
 @njit(cache=True)
 def sakoe_chiba(x: np.ndarray, y: np.ndarray, window: float) -> np.ndarray:
     """Create a sakoe chiba lower bounding window on a matrix.
@@ -164,6 +190,79 @@ def sakoe_chiba(x: np.ndarray, y: np.ndarray, window: float) -> np.ndarray:
     return bounding_matrix
 
 
+@njit(cache=True)
+def sakoe_chiba_bounds(
+    x_size: int, y_size: int, window: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Create a sakoe chiba lower bounding window as per row index bounds.
+
+    This is the same window as created by sakoe_chiba, but stored as the first and
+    last in bound column of every row instead of a full (x_size, y_size) matrix.
+
+    Parameters
+    ----------
+    x_size: int
+        Number of timepoints of the first time series.
+    y_size: int
+        Number of timepoints of the second time series.
+    window: float
+        Float that is the size of the window. Must be between 0 and 1.
+
+    Returns
+    -------
+    np.ndarray (1d array of size x_size)
+        First in bound column index of each row.
+    np.ndarray (1d array of size x_size)
+        Last in bound column index of each row. Rows where this is smaller than
+        the first index have no index in bound.
+
+    Raises
+    ------
+    ValueError
+        If the window is not between 0 and 1.
+    """
+    if window < 0 or window > 1:
+        raise ValueError("Window must between 0 and 1")
+
+    sakoe_chiba_window_radius = ((x_size / 100) * window) * 100
+
+    x_upper_line_values = np.interp(
+        list(range(x_size)),
+        [0, x_size - 1],
+        [0 - sakoe_chiba_window_radius, y_size - sakoe_chiba_window_radius - 1],
+    )
+    x_lower_line_values = np.interp(
+        list(range(x_size)),
+        [0, x_size - 1],
+        [0 + sakoe_chiba_window_radius, y_size + sakoe_chiba_window_radius - 1],
+    )
+
+    lower_bounds = np.zeros(x_size, dtype=np.int64)
+    upper_bounds = np.zeros(x_size, dtype=np.int64)
+
+    # column j covers the rows [ceil(upper line), floor(lower line)], see
+    # create_shape_on_matrix. Both lines are non decreasing, so the columns in
+    # bound of row i are contiguous and can be found with two moving pointers.
+    num_columns = min(x_size, y_size)
+    first = 0
+    last = 0
+    for i in range(x_size):
+        while (
+            first < num_columns
+            and max(0, min(x_size - 1, math.floor(x_lower_line_values[first]))) < i
+        ):
+            first += 1
+        while (
+            last < num_columns
+            and max(0, min(x_size - 1, math.ceil(x_upper_line_values[last]))) <= i
+        ):
+            last += 1
+        lower_bounds[i] = first
+        upper_bounds[i] = last - 1
+
+    return lower_bounds, upper_bounds
+
+
 @njit(cache=True)
 def itakura_parallelogram(
     x: np.ndarray, y: np.ndarray, itakura_max_slope: float
@@ -1,4 +1,6 @@
 """Test suite for lower bounding techniques."""
+import math
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -6,6 +8,7 @@ import pytest
 from sktime.distances.lower_bounding import LowerBounding
 from sktime.distances.tests._utils import create_test_distance_numpy
 from sktime.tests.test_switch import run_test_module_changed
+from sktime.utils.dependencies import _check_soft_dependencies
 
 
 def _validate_bounding_result(
@@ -222,3 +225,60 @@ def test_incorrect_parameters() -> None:
         sakoe_chiba.create_bounding_matrix(
             numpy_x, numpy_y, sakoe_chiba_window_radius=1.2, itakura_max_slope=10.0
         )
+
+
+def _sakoe_chiba_in_bound(x_size: int, y_size: int, window: float) -> np.ndarray:
+    """Reference sakoe chiba window, filled column by column as in sakoe_chiba.
+
+    Unlike sakoe_chiba, columns beyond y_size are skipped, so it is also defined
+    when the first series is the longer one.
+    """
+    radius = ((x_size / 100) * window) * 100
+    upper_line = np.interp(
+        range(x_size), [0, x_size - 1], [-radius, y_size - radius - 1]
+    )
+    lower_line = np.interp(
+        range(x_size), [0, x_size - 1], [radius, y_size + radius - 1]
+    )
+    in_bound = np.zeros((x_size, y_size), dtype=bool)
+    for j in range(min(x_size, y_size)):
+        first = max(0, min(x_size - 1, math.ceil(upper_line[j])))
+        last = max(0, min(x_size - 1, math.floor(lower_line[j])))
+        in_bound[first : last + 1, j] = True
+    return in_bound
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none")
+    or not run_test_module_changed("sktime.distances"),
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("y_size", [10, 15, 20])
+@pytest.mark.parametrize("window", [0.0, 0.1, 0.25, 1.0])
+def test_sakoe_chiba_bounds(y_size, window) -> None:
+    """Test sakoe chiba index bounds match the sakoe chiba window."""
+    from sktime.distances._dtw_numba import _bounded_cost_matrix, _cost_matrix
+    from sktime.distances._lower_bounding_numba import sakoe_chiba_bounds
+
+    x = create_test_distance_numpy(2, 15)
+    y = create_test_distance_numpy(2, y_size, random_state=2)
+
+    in_bound = _sakoe_chiba_in_bound(x.shape[1], y.shape[1], window)
+    if y.shape[1] >= x.shape[1]:
+        # sakoe_chiba only fills the matrix correctly if x is not the longer series
+        bounding_matrix = LowerBounding.SAKOE_CHIBA.create_bounding_matrix(
+            x, y, sakoe_chiba_window_radius=window
+        )
+        np.testing.assert_array_equal(np.isfinite(bounding_matrix), in_bound)
+    lower_bounds, upper_bounds = sakoe_chiba_bounds(x.shape[1], y.shape[1], window)
+
+    columns = np.arange(y.shape[1])
+    for i in range(x.shape[1]):
+        np.testing.assert_array_equal(
+            in_bound[i], (columns >= lower_bounds[i]) & (columns <= upper_bounds[i])
+        )
+
+    np.testing.assert_array_equal(
+        _bounded_cost_matrix(x, y, lower_bounds, upper_bounds),
+        _cost_matrix(x, y, np.where(in_bound, 0.0, np.inf)),
+    )
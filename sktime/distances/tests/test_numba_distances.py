@@ -241,3 +241,52 @@ def test_distance_factory_1d():
 
     assert first == 14.906015491572047
     assert second == 422.81946268212846
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none")
+    or not run_test_module_changed("sktime.distances"),  # noqa: E501
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("window", [None, 0.0, 0.2, 1.0])
+def test_ddtw_fused_derivative(window):
+    """Test the fused ddtw derivative matches the materialised derivatives."""
+    from sktime.distances._ddtw_numba import _ddtw_bounded_distance, average_of_slope
+    from sktime.distances._dtw_numba import _bounded_cost_matrix
+    from sktime.distances._lower_bounding_numba import (
+        no_bounding_bounds,
+        sakoe_chiba_bounds,
+    )
+
+    x = create_test_distance_numpy(3, 40)
+    y = create_test_distance_numpy(3, 50, random_state=2)
+    if window is None:
+        lower_bounds, upper_bounds = no_bounding_bounds(x.shape[1], y.shape[1])
+    else:
+        lower_bounds, upper_bounds = sakoe_chiba_bounds(x.shape[1], y.shape[1], window)
+
+    cost_matrix = _bounded_cost_matrix(
+        average_of_slope(x), average_of_slope(y), lower_bounds, upper_bounds
+    )
+    assert_almost_equal(
+        _ddtw_bounded_distance(x, y, lower_bounds, upper_bounds), cost_matrix[-1, -1]
+    )
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none")
+    or not run_test_module_changed("sktime.distances"),  # noqa: E501
+    reason="skip test if required soft dependency not available",
+)
+def test_average_of_slope_dtype():
+    """Test average_of_slope promotes integer series and keeps float dtypes."""
+    from sktime.distances._ddtw_numba import average_of_slope
+
+    derivative = average_of_slope(np.array([[1, 2, 4, 7, 11]]))
+    assert derivative.dtype == np.float64
+    np.testing.assert_array_equal(derivative, [[1.25, 2.25, 3.25]])
+
+    for dtype in [np.float32, np.float64]:
+        assert (
+            average_of_slope(np.array([[1, 2, 4, 7, 11]], dtype=dtype)).dtype == dtype
+        )
@@ -293,3 +293,49 @@ def test_metric_parameters():
 def test_incorrect_parameters():
     """Ensure incorrect parameters raise errors."""
     _test_incorrect_parameters(pairwise_distance)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none")
+    or not run_test_module_changed("sktime.distances"),  # noqa: E501
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("window", [None, 0.2])
+def test_ddtw_pairwise_derivative_once(window):
+    """Test the panel ddtw pairwise matches the distance of every single pair."""
+    from sktime.distances import ddtw_distance
+
+    x = create_test_distance_numpy(6, 2, 12)
+    y = create_test_distance_numpy(4, 2, 12, random_state=2)
+    kwargs = {} if window is None else {"window": window}
+
+    for y_panel in [y, None]:
+        pw_result = pairwise_distance(x, y_panel, metric="ddtw", **kwargs)
+        y_panel = x if y_panel is None else y_panel
+        expected = np.zeros((len(x), len(y_panel)))
+        for i in range(len(x)):
+            for j in range(len(y_panel)):
+                expected[i, j] = ddtw_distance(x[i], y_panel[j], **kwargs)
+        assert np.allclose(pw_result, expected)
+
+
+@pytest.mark.skipif(
+    not _check_soft_dependencies("numba", severity="none")
+    or not run_test_module_changed("sktime.distances"),  # noqa: E501
+    reason="skip test if required soft dependency not available",
+)
+@pytest.mark.parametrize("window", [None, 0.1])
+def test_ddtw_pairwise_compiled_once(window):
+    """Test repeated panel ddtw pairwise calls reuse the compiled kernel."""
+    from sktime.distances._dtw_numba import _bounded_dtw_pairwise_distance
+
+    x = create_test_distance_numpy(6, 2, 12)
+    pairwise_distance(x, metric="ddtw", window=window)
+    n_signatures = len(_bounded_dtw_pairwise_distance.signatures)
+
+    for random_state in [1, 2]:
+        y = create_test_distance_numpy(4, 2, 20, random_state=random_state)
+        pairwise_distance(x, y, metric="ddtw", window=window)
+        pairwise_distance(y, metric="ddtw", window=window)
+
+    assert len(_bounded_dtw_pairwise_distance.signatures) == n_signatures
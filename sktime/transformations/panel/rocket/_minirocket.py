@@ -3,12 +3,29 @@
 __author__ = ["angus924"]
 __all__ = ["MiniRocket"]
 
-import multiprocessing
+import os
+import tempfile
 
 import numpy as np
-import pandas as pd
 
 from sktime.transformations.base import BaseTransformer
+from sktime.utils.parallel import _available_cores, _with_numba_threads
+
+# numba kernels, imported on first use so that numba stays a soft dependency
+_MR_NUMBA = None
+
+
+def _get_numba():
+    """Return the compiled ``(_fit, _transform)`` kernels, importing them once."""
+    global _MR_NUMBA
+    if _MR_NUMBA is None:
+        from sktime.transformations.panel.rocket._minirocket_numba import (
+            _fit,
+            _transform,
+        )
+
+        _MR_NUMBA = (_fit, _transform)
+    return _MR_NUMBA
 
 
 class MiniRocket(BaseTransformer):
@@ -38,6 +55,18 @@ class MiniRocket(BaseTransformer):
         The number of jobs to run in parallel for ``transform``. ``-1`` means using all
         processors.
     random_state : None or int, default = None
+    device : str, one of "cpu" or "cuda", default="cpu"
+        Device to run ``transform`` on. ``"cuda"`` runs the convolutions on a cuda
+        capable gpu via ``numba.cuda``, which pays off for large panels. Results can
+        differ from the cpu transform in rare cases where a convolution output is
+        within rounding error of a bias.
+    param_store : None or str, default=None
+        Directory to keep the fitted parameters in. If None, they are held in memory.
+        If a path, every ``fit`` writes the parameters as ``.npy`` files into a new
+        uniquely named subdirectory of it and reads them back as memory maps, so
+        that the operating system pages them in on demand rather than every fitted
+        instance holding them in memory. Clones can share the directory. The
+        subdirectories are not removed when an instance is refitted or deleted.
 
     See Also
     --------
@@ -89,12 +118,16 @@ class MiniRocket(BaseTransformer):
         max_dilations_per_kernel=32,
         n_jobs=1,
         random_state=None,
+        device="cpu",
+        param_store=None,
     ):
         self.num_kernels = num_kernels
         self.max_dilations_per_kernel = max_dilations_per_kernel
 
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.device = device
+        self.param_store = param_store
         super().__init__()
 
     def _fit(self, X, y=None):
@@ -110,13 +143,13 @@ class MiniRocket(BaseTransformer):
         -------
         self
         """
-        from sktime.transformations.panel.rocket._minirocket_numba import _fit
+        _fit, _ = _get_numba()
 
         random_state = (
             np.int32(self.random_state) if isinstance(self.random_state, int) else None
         )
 
-        X = X[:, 0, :].astype(np.float32)
+        X = X[:, 0, :].astype(np.float32, copy=False)
         _, n_timepoints = X.shape
         if n_timepoints < 9:
             raise ValueError(
@@ -126,8 +159,37 @@ class MiniRocket(BaseTransformer):
         self.parameters = _fit(
             X, self.num_kernels, self.max_dilations_per_kernel, random_state
         )
+        if self.param_store is not None:
+            self.parameters = self._store_parameters(self.parameters)
         return self
 
+    def _store_parameters(self, parameters):
+        """Write fitted parameters to param_store and reopen them as memory maps.
+
+        Parameters
+        ----------
+        parameters : tuple of (dilations, num_features_per_dilation, biases)
+            fitted parameters, as returned by _minirocket_numba._fit
+
+        Returns
+        -------
+        tuple of np.memmap, the same parameters backed by files in param_store
+        """
+        os.makedirs(self.param_store, exist_ok=True)
+        # a new directory per fit, files still mapped by another fitted instance,
+        # e.g., a clone sharing param_store, must never be overwritten
+        directory = tempfile.mkdtemp(prefix="minirocket_", dir=self.param_store)
+
+        stored = []
+        names = ("dilations", "num_features_per_dilation", "biases")
+        for name, array in zip(names, parameters):
+            path = os.path.join(directory, f"{name}.npy")
+            np.save(path, array)
+            # copy-on-write rather than read-only, the compiled transform only
+            # accepts writeable arrays
+            stored.append(np.load(path, mmap_mode="c"))
+        return tuple(stored)
+
     def _transform(self, X, y=None):
         """Transform input time series.
 
@@ -139,21 +201,46 @@ class MiniRocket(BaseTransformer):
 
         Returns
         -------
-        pandas DataFrame, transformed features
+        2D np.ndarray of shape = [n_instances, num_features], transformed features
         """
-        from numba import get_num_threads, set_num_threads
-
-        from sktime.transformations.panel.rocket._minirocket_numba import _transform
-
-        X = X[:, 0, :].astype(np.float32)
-
-        # change n_jobs depended on value and existing cores
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-        X_ = _transform(X, self.parameters)
-        set_num_threads(prev_threads)
-        return pd.DataFrame(X_)
+        _, _transform = _get_numba()
+
+        X = X[:, 0, :].astype(np.float32, copy=False)
+
+        if self.device == "cuda":
+            return self._transform_cuda(X)
+        if self.device != "cpu":
+            raise ValueError(
+                f'device in MiniRocket must be "cpu" or "cuda", but found {self.device}'
+            )
+
+        # change n_jobs depended on value and available cores of this host
+        n_jobs = self.n_jobs
+        if n_jobs < 1 or n_jobs > _available_cores():
+            n_jobs = _available_cores()
+        with _with_numba_threads(n_jobs):
+            X_ = _transform(X, self.parameters)
+        return X_
+
+    def _transform_cuda(self, X):
+        """Transform input time series on a cuda device.
+
+        Parameters
+        ----------
+        X : 2D np.ndarray of shape = [n_instances, series_length], float32
+            panel of univariate time series to transform
+
+        Returns
+        -------
+        2D np.ndarray, transformed features
+        """
+        from numba import cuda
+
+        from sktime.transformations.panel.rocket._minirocket_cuda import _transform_cuda
+
+        if not cuda.is_available():
+            raise RuntimeError(
+                'MiniRocket with device="cuda" requires a cuda capable gpu, but '
+                "numba.cuda could not find one"
+            )
+        return _transform_cuda(X, self.parameters)
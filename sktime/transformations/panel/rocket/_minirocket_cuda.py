@@ -0,0 +1,144 @@
+"""Isolated numba cuda imports for _minirocket."""
+
+__author__ = ["angus924"]
+
+import numpy as np
+
+from sktime.transformations.panel.rocket._minirocket_numba import _INDICES
+from sktime.utils.dependencies import _check_soft_dependencies
+
+# number of threads per block, each block strides over the timepoints of one series
+_THREADS_PER_BLOCK = 128
+# size of the per block shared memory counters, one per feature of a combination
+_MAX_FEATURES_PER_COMBINATION = 1024
+
+if _check_soft_dependencies("numba", severity="none"):
+    from numba import cuda
+
+    @cuda.jit
+    def _transform_cuda_kernel(
+        X,
+        dilations,
+        num_features_per_dilation,
+        feature_starts,
+        biases,
+        indices,
+        counts,
+    ):
+        # one block per (instance, kernel x dilation combination)
+        example_index = cuda.blockIdx.x
+        combination_index = cuda.blockIdx.y
+
+        num_kernels = indices.shape[0]
+        dilation_index = combination_index // num_kernels
+        kernel_index = combination_index % num_kernels
+
+        n_timepoints = X.shape[1]
+        dilation = dilations[dilation_index]
+        padding = ((9 - 1) * dilation) // 2
+        num_features_this_dilation = num_features_per_dilation[dilation_index]
+        feature_index_start = feature_starts[combination_index]
+
+        _padding1 = (dilation_index % 2 + kernel_index) % 2
+        if _padding1 == 0:
+            ppv_start = 0
+            ppv_end = n_timepoints
+        else:
+            ppv_start = padding
+            ppv_end = n_timepoints - padding
+
+        index_0 = indices[kernel_index, 0]
+        index_1 = indices[kernel_index, 1]
+        index_2 = indices[kernel_index, 2]
+
+        block_counts = cuda.shared.array(_MAX_FEATURES_PER_COMBINATION, np.int32)
+        for feature_count in range(
+            cuda.threadIdx.x, num_features_this_dilation, cuda.blockDim.x
+        ):
+            block_counts[feature_count] = 0
+        cuda.syncthreads()
+
+        for t in range(ppv_start + cuda.threadIdx.x, ppv_end, cuda.blockDim.x):
+            # weights are -1 everywhere and +2 at the three gamma positions, with
+            # zero padding outside of the series
+            C = np.float32(0.0)
+            for weight_index in range(9):
+                position = t + (weight_index - 9 // 2) * dilation
+                if 0 <= position < n_timepoints:
+                    value = X[example_index, position]
+                    if (
+                        weight_index == index_0
+                        or weight_index == index_1
+                        or weight_index == index_2
+                    ):
+                        C += value + value
+                    else:
+                        C -= value
+
+            for feature_count in range(num_features_this_dilation):
+                if C > biases[feature_index_start + feature_count]:
+                    cuda.atomic.add(block_counts, feature_count, 1)
+        cuda.syncthreads()
+
+        for feature_count in range(
+            cuda.threadIdx.x, num_features_this_dilation, cuda.blockDim.x
+        ):
+            counts[example_index, feature_index_start + feature_count] = block_counts[
+                feature_count
+            ]
+
+
+def _transform_cuda(X, parameters):
+    """Transform on a cuda device, equivalent to _minirocket_numba._transform.
+
+    Parameters
+    ----------
+    X : 2D np.ndarray of shape = [n_instances, series_length], float32
+        panel of univariate time series to transform
+    parameters : tuple of (dilations, num_features_per_dilation, biases)
+        fitted parameters, as returned by _minirocket_numba._fit
+
+    Returns
+    -------
+    2D np.ndarray of shape = [n_instances, num_features], float32
+    """
+    dilations, num_features_per_dilation, biases = parameters
+
+    n_instances, n_timepoints = X.shape
+    num_kernels = len(_INDICES)
+    num_dilations = len(dilations)
+    num_features = num_kernels * np.sum(num_features_per_dilation)
+
+    if np.max(num_features_per_dilation) > _MAX_FEATURES_PER_COMBINATION:
+        raise ValueError(
+            f"the cuda transform of MiniRocket supports at most "
+            f"{_MAX_FEATURES_PER_COMBINATION} features per kernel and dilation, but "
+            f"found {np.max(num_features_per_dilation)}; reduce num_kernels"
+        )
+
+    # first feature index and ppv length of each (dilation, kernel) combination,
+    # in the same feature order as the cpu transform
+    features_per_combination = np.repeat(num_features_per_dilation, num_kernels)
+    feature_starts = np.zeros(num_dilations * num_kernels, dtype=np.int32)
+    feature_starts[1:] = np.cumsum(features_per_combination)[:-1]
+
+    padded = (np.arange(num_dilations)[:, None] + np.arange(num_kernels)) % 2
+    paddings = ((9 - 1) * dilations) // 2
+    ppv_lengths = np.where(
+        padded == 1, n_timepoints - 2 * paddings[:, None], n_timepoints
+    ).ravel()
+
+    blocks = (n_instances, num_dilations * num_kernels)
+    counts = cuda.device_array((n_instances, num_features), dtype=np.int32)
+    _transform_cuda_kernel[blocks, _THREADS_PER_BLOCK](
+        cuda.to_device(X),
+        cuda.to_device(dilations),
+        cuda.to_device(num_features_per_dilation),
+        cuda.to_device(feature_starts),
+        cuda.to_device(biases),
+        cuda.to_device(_INDICES),
+        counts,
+    )
+
+    lengths = np.repeat(ppv_lengths, features_per_combination)
+    return (counts.copy_to_host() / lengths).astype(np.float32)
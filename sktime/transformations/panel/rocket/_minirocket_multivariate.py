@@ -3,12 +3,26 @@
 __author__ = ["angus924"]
 __all__ = ["MiniRocketMultivariate"]
 
-import multiprocessing
-
 import numpy as np
-import pandas as pd
 
 from sktime.transformations.base import BaseTransformer
+from sktime.utils.parallel import _available_cores, _with_numba_threads
+
+# numba kernels, imported on first use so that numba stays a soft dependency
+_MR_NUMBA = None
+
+
+def _get_numba():
+    """Return the compiled ``(_fit_multi, _transform_multi)``, importing them once."""
+    global _MR_NUMBA
+    if _MR_NUMBA is None:
+        from sktime.transformations.panel.rocket._minirocket_multi_numba import (
+            _fit_multi,
+            _transform_multi,
+        )
+
+        _MR_NUMBA = (_fit_multi, _transform_multi)
+    return _MR_NUMBA
 
 
 class MiniRocketMultivariate(BaseTransformer):
@@ -117,11 +131,9 @@ class MiniRocketMultivariate(BaseTransformer):
         -------
         self
         """
-        from sktime.transformations.panel.rocket._minirocket_multi_numba import (
-            _fit_multi,
-        )
+        _fit_multi, _ = _get_numba()
 
-        X = X.astype(np.float32)
+        X = X.astype(np.float32, copy=False)
         *_, n_timepoints = X.shape
         if n_timepoints < 9:
             raise ValueError(
@@ -144,22 +156,15 @@ class MiniRocketMultivariate(BaseTransformer):
 
         Returns
         -------
-        pandas DataFrame, transformed features
+        2D np.ndarray of shape = [n_instances, num_features], transformed features
         """
-        from numba import get_num_threads, set_num_threads
-
-        from sktime.transformations.panel.rocket._minirocket_multi_numba import (
-            _transform_multi,
-        )
-
-        X = X.astype(np.float32)
-        # change n_jobs depended on value and existing cores
-        prev_threads = get_num_threads()
-        if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
-            n_jobs = multiprocessing.cpu_count()
-        else:
-            n_jobs = self.n_jobs
-        set_num_threads(n_jobs)
-        X_ = _transform_multi(X, self.parameters)
-        set_num_threads(prev_threads)
-        return pd.DataFrame(X_)
+        _, _transform_multi = _get_numba()
+
+        X = X.astype(np.float32, copy=False)
+        # change n_jobs depended on value and available cores of this host
+        n_jobs = self.n_jobs
+        if n_jobs < 1 or n_jobs > _available_cores():
+            n_jobs = _available_cores()
+        with _with_numba_threads(n_jobs):
+            X_ = _transform_multi(X, self.parameters)
+        return X_
@@ -2,20 +2,20 @@
 
 __author__ = ["angus924"]
 
+from itertools import combinations
+
 import numpy as np
 
 from sktime.utils.dependencies import _check_soft_dependencies
 from sktime.utils.numba.njit import njit
 
-if _check_soft_dependencies("numba", severity="none"):
-    from numba import prange, vectorize
+# the 84 fixed MiniRocket kernels, given by the positions of the three gamma weights
+# out of the nine kernel weights; as a global array this is frozen into the compiled
+# kernels as a compile-time constant instead of being built on every call
+_INDICES = np.array(list(combinations(range(9), 3)), dtype=np.int32)
 
-    @vectorize("float32(float32,float32)", nopython=True, cache=True)
-    def _PPV(a, b):
-        if a > b:
-            return 1
-        else:
-            return 0
+if _check_soft_dependencies("numba", severity="none"):
+    from numba import prange
 
 
 @njit(
@@ -30,266 +30,7 @@ def _fit_biases(X, dilations, num_features_per_dilation, quantiles, seed):
 
     n_instances, n_timepoints = X.shape
 
-    # equivalent to:
-    # >>> from itertools import combinations
-    # >>> indices = np.array([_ for _ in combinations(np.arange(9), 3)])
-    indices = np.array(
-        (
-            0,
-            1,
-            2,
-            0,
-            1,
-            3,
-            0,
-            1,
-            4,
-            0,
-            1,
-            5,
-            0,
-            1,
-            6,
-            0,
-            1,
-            7,
-            0,
-            1,
-            8,
-            0,
-            2,
-            3,
-            0,
-            2,
-            4,
-            0,
-            2,
-            5,
-            0,
-            2,
-            6,
-            0,
-            2,
-            7,
-            0,
-            2,
-            8,
-            0,
-            3,
-            4,
-            0,
-            3,
-            5,
-            0,
-            3,
-            6,
-            0,
-            3,
-            7,
-            0,
-            3,
-            8,
-            0,
-            4,
-            5,
-            0,
-            4,
-            6,
-            0,
-            4,
-            7,
-            0,
-            4,
-            8,
-            0,
-            5,
-            6,
-            0,
-            5,
-            7,
-            0,
-            5,
-            8,
-            0,
-            6,
-            7,
-            0,
-            6,
-            8,
-            0,
-            7,
-            8,
-            1,
-            2,
-            3,
-            1,
-            2,
-            4,
-            1,
-            2,
-            5,
-            1,
-            2,
-            6,
-            1,
-            2,
-            7,
-            1,
-            2,
-            8,
-            1,
-            3,
-            4,
-            1,
-            3,
-            5,
-            1,
-            3,
-            6,
-            1,
-            3,
-            7,
-            1,
-            3,
-            8,
-            1,
-            4,
-            5,
-            1,
-            4,
-            6,
-            1,
-            4,
-            7,
-            1,
-            4,
-            8,
-            1,
-            5,
-            6,
-            1,
-            5,
-            7,
-            1,
-            5,
-            8,
-            1,
-            6,
-            7,
-            1,
-            6,
-            8,
-            1,
-            7,
-            8,
-            2,
-            3,
-            4,
-            2,
-            3,
-            5,
-            2,
-            3,
-            6,
-            2,
-            3,
-            7,
-            2,
-            3,
-            8,
-            2,
-            4,
-            5,
-            2,
-            4,
-            6,
-            2,
-            4,
-            7,
-            2,
-            4,
-            8,
-            2,
-            5,
-            6,
-            2,
-            5,
-            7,
-            2,
-            5,
-            8,
-            2,
-            6,
-            7,
-            2,
-            6,
-            8,
-            2,
-            7,
-            8,
-            3,
-            4,
-            5,
-            3,
-            4,
-            6,
-            3,
-            4,
-            7,
-            3,
-            4,
-            8,
-            3,
-            5,
-            6,
-            3,
-            5,
-            7,
-            3,
-            5,
-            8,
-            3,
-            6,
-            7,
-            3,
-            6,
-            8,
-            3,
-            7,
-            8,
-            4,
-            5,
-            6,
-            4,
-            5,
-            7,
-            4,
-            5,
-            8,
-            4,
-            6,
-            7,
-            4,
-            6,
-            8,
-            4,
-            7,
-            8,
-            5,
-            6,
-            7,
-            5,
-            6,
-            8,
-            5,
-            7,
-            8,
-            6,
-            7,
-            8,
-        ),
-        dtype=np.int32,
-    ).reshape(84, 3)
+    indices = _INDICES
 
     num_kernels = len(indices)
     num_dilations = len(dilations)
@@ -385,6 +126,18 @@ def _quantiles(n):
 
 
 def _fit(X, num_features=10_000, max_dilations_per_kernel=32, seed=None):
+    """Fit the MiniRocket parameters.
+
+    The parameters are stored as a struct of arrays, which is what ``_transform``
+    expects, so the bias of each feature is read from one contiguous array.
+
+    Returns
+    -------
+    dilations : 1D np.ndarray of int32, shape = [num_dilations]
+    num_features_per_dilation : 1D np.ndarray of int32, shape = [num_dilations]
+    biases : 1D np.ndarray of float32, shape = [num_features]
+        biases in feature order, i.e., by dilation, then kernel, then quantile
+    """
     _, n_timepoints = X.shape
 
     num_kernels = 84
@@ -404,7 +157,6 @@ def _fit(X, num_features=10_000, max_dilations_per_kernel=32, seed=None):
 
 @njit(
     "float32[:,:](float32[:,:],Tuple((int32[:],int32[:],float32[:])))",
-    fastmath=True,
     parallel=True,
     cache=True,
 )
@@ -413,266 +165,7 @@ def _transform(X, parameters):
 
     dilations, num_features_per_dilation, biases = parameters
 
-    # equivalent to:
-    # >>> from itertools import combinations
-    # >>> indices = np.array([_ for _ in combinations(np.arange(9), 3)])
-    indices = np.array(
-        (
-            0,
-            1,
-            2,
-            0,
-            1,
-            3,
-            0,
-            1,
-            4,
-            0,
-            1,
-            5,
-            0,
-            1,
-            6,
-            0,
-            1,
-            7,
-            0,
-            1,
-            8,
-            0,
-            2,
-            3,
-            0,
-            2,
-            4,
-            0,
-            2,
-            5,
-            0,
-            2,
-            6,
-            0,
-            2,
-            7,
-            0,
-            2,
-            8,
-            0,
-            3,
-            4,
-            0,
-            3,
-            5,
-            0,
-            3,
-            6,
-            0,
-            3,
-            7,
-            0,
-            3,
-            8,
-            0,
-            4,
-            5,
-            0,
-            4,
-            6,
-            0,
-            4,
-            7,
-            0,
-            4,
-            8,
-            0,
-            5,
-            6,
-            0,
-            5,
-            7,
-            0,
-            5,
-            8,
-            0,
-            6,
-            7,
-            0,
-            6,
-            8,
-            0,
-            7,
-            8,
-            1,
-            2,
-            3,
-            1,
-            2,
-            4,
-            1,
-            2,
-            5,
-            1,
-            2,
-            6,
-            1,
-            2,
-            7,
-            1,
-            2,
-            8,
-            1,
-            3,
-            4,
-            1,
-            3,
-            5,
-            1,
-            3,
-            6,
-            1,
-            3,
-            7,
-            1,
-            3,
-            8,
-            1,
-            4,
-            5,
-            1,
-            4,
-            6,
-            1,
-            4,
-            7,
-            1,
-            4,
-            8,
-            1,
-            5,
-            6,
-            1,
-            5,
-            7,
-            1,
-            5,
-            8,
-            1,
-            6,
-            7,
-            1,
-            6,
-            8,
-            1,
-            7,
-            8,
-            2,
-            3,
-            4,
-            2,
-            3,
-            5,
-            2,
-            3,
-            6,
-            2,
-            3,
-            7,
-            2,
-            3,
-            8,
-            2,
-            4,
-            5,
-            2,
-            4,
-            6,
-            2,
-            4,
-            7,
-            2,
-            4,
-            8,
-            2,
-            5,
-            6,
-            2,
-            5,
-            7,
-            2,
-            5,
-            8,
-            2,
-            6,
-            7,
-            2,
-            6,
-            8,
-            2,
-            7,
-            8,
-            3,
-            4,
-            5,
-            3,
-            4,
-            6,
-            3,
-            4,
-            7,
-            3,
-            4,
-            8,
-            3,
-            5,
-            6,
-            3,
-            5,
-            7,
-            3,
-            5,
-            8,
-            3,
-            6,
-            7,
-            3,
-            6,
-            8,
-            3,
-            7,
-            8,
-            4,
-            5,
-            6,
-            4,
-            5,
-            7,
-            4,
-            5,
-            8,
-            4,
-            6,
-            7,
-            4,
-            6,
-            8,
-            4,
-            7,
-            8,
-            5,
-            6,
-            7,
-            5,
-            6,
-            8,
-            5,
-            7,
-            8,
-            6,
-            7,
-            8,
-        ),
-        dtype=np.int32,
-    ).reshape(84, 3)
+    indices = _INDICES
 
     num_kernels = len(indices)
     num_dilations = len(dilations)
@@ -681,12 +174,25 @@ def _transform(X, parameters):
 
     features = np.zeros((n_instances, num_features), dtype=np.float32)
 
+    max_padding = ((9 - 1) * np.max(dilations)) // 2
+
     for example_index in prange(n_instances):
         _X = X[example_index]
 
         A = -_X  # A = alpha * X = -X
         G = _X + _X + _X  # G = gamma * X = 3X
 
+        # G zero padded once for the largest dilation; the gamma term of weight
+        # position g at dilation d is then the contiguous slice of G_padded shifted
+        # by (g - 4) * d, for every dilation, instead of a per-dilation copy
+        G_padded = np.zeros(n_timepoints + 2 * max_padding, dtype=np.float32)
+        G_padded[max_padding : max_padding + n_timepoints] = G
+
+        # per-instance work buffers, reused across all dilations and kernels so
+        # that the convolution outputs stay cache resident for the instance
+        C_alpha = np.empty(n_timepoints, dtype=np.float32)
+        C = np.empty(n_timepoints, dtype=np.float32)
+
         feature_index_start = 0
 
         for dilation_index in range(num_dilations):
@@ -697,24 +203,18 @@ def _transform(X, parameters):
 
             num_features_this_dilation = num_features_per_dilation[dilation_index]
 
-            C_alpha = np.zeros(n_timepoints, dtype=np.float32)
             C_alpha[:] = A
 
-            C_gamma = np.zeros((9, n_timepoints), dtype=np.float32)
-            C_gamma[9 // 2] = G
-
             start = dilation
             end = n_timepoints - padding
 
-            for gamma_index in range(9 // 2):
+            for _ in range(9 // 2):
                 C_alpha[-end:] = C_alpha[-end:] + A[:end]
-                C_gamma[gamma_index, -end:] = G[:end]
 
                 end += dilation
 
-            for gamma_index in range(9 // 2 + 1, 9):
+            for _ in range(9 // 2 + 1, 9):
                 C_alpha[:-start] = C_alpha[:-start] + A[start:]
-                C_gamma[gamma_index, :-start] = G[start:]
 
                 start += dilation
 
@@ -724,22 +224,39 @@ def _transform(X, parameters):
                 _padding1 = (_padding0 + kernel_index) % 2
 
                 index_0, index_1, index_2 = indices[kernel_index]
-
-                C = C_alpha + C_gamma[index_0] + C_gamma[index_1] + C_gamma[index_2]
+                offset_0 = max_padding + (index_0 - 9 // 2) * dilation
+                offset_1 = max_padding + (index_1 - 9 // 2) * dilation
+                offset_2 = max_padding + (index_2 - 9 // 2) * dilation
 
                 if _padding1 == 0:
-                    for feature_count in range(num_features_this_dilation):
-                        features[
-                            example_index, feature_index_start + feature_count
-                        ] = _PPV(C, biases[feature_index_start + feature_count]).mean()
+                    ppv_start = 0
+                    ppv_end = n_timepoints
                 else:
-                    for feature_count in range(num_features_this_dilation):
-                        features[
-                            example_index, feature_index_start + feature_count
-                        ] = _PPV(
-                            C[padding:-padding],
-                            biases[feature_index_start + feature_count],
-                        ).mean()
+                    ppv_start = padding
+                    ppv_end = n_timepoints - padding
+
+                # only the timepoints used for the ppv are convolved, summed left to
+                # right in float32 like the whole-array adds, without fastmath so the
+                # order is not reassociated and outputs close to a bias do not flip
+                for t in range(ppv_start, ppv_end):
+                    C[t] = (
+                        C_alpha[t]
+                        + G_padded[t + offset_0]
+                        + G_padded[t + offset_1]
+                        + G_padded[t + offset_2]
+                    )
+
+                # count positive values as integers, only the final proportion
+                # is converted to floating point
+                for feature_count in range(num_features_this_dilation):
+                    bias = biases[feature_index_start + feature_count]
+                    num_positive = 0
+                    for t in range(ppv_start, ppv_end):
+                        if C[t] > bias:
+                            num_positive += 1
+                    features[
+                        example_index, feature_index_start + feature_count
+                    ] = num_positive / (ppv_end - ppv_start)
 
                 feature_index_start = feature_index_end
 
@@ -54,3 +54,72 @@ def test_minirocket_on_gunpoint():
 
     # test predictions (on Gunpoint, should be > 99% accurate)
     assert accuracy > 0.99
+
+
+def _cuda_available():
+    """Check whether numba can find a cuda capable gpu."""
+    try:
+        from numba import cuda
+
+        return cuda.is_available()
+    except ImportError:
+        return False
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(MiniRocket) or not _cuda_available(),
+    reason="run test only if softdeps and a cuda gpu are present",
+)
+def test_minirocket_cuda_matches_cpu():
+    """Test that the cuda transform of MiniRocket matches the cpu transform."""
+    X_training, _ = load_gunpoint(split="train", return_X_y=True)
+    X_cpu = MiniRocket(random_state=0).fit_transform(X_training)
+    X_cuda = MiniRocket(random_state=0, device="cuda").fit_transform(X_training)
+
+    np.testing.assert_equal(X_cuda.shape, X_cpu.shape)
+    # a convolution output within rounding error of a bias can be counted on the
+    # other side on the gpu, which moves that feature by one timepoint of its ppv,
+    # so only a small fraction of features is allowed to differ
+    mismatch = ~np.isclose(X_cuda.values, X_cpu.values, rtol=0, atol=1e-6)
+    assert mismatch.mean() < 0.01
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(MiniRocket),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_minirocket_param_store(tmp_path):
+    """Test that memory mapped parameters give the same transform."""
+    X_training, _ = load_gunpoint(split="train", return_X_y=True)
+
+    minirocket = MiniRocket(num_kernels=840, random_state=0).fit(X_training)
+    minirocket_stored = MiniRocket(
+        num_kernels=840, random_state=0, param_store=str(tmp_path)
+    ).fit(X_training)
+
+    assert all(isinstance(p, np.memmap) for p in minirocket_stored.parameters)
+    np.testing.assert_array_equal(
+        minirocket_stored.transform(X_training).values,
+        minirocket.transform(X_training).values,
+    )
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(MiniRocket),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_minirocket_param_store_shared(tmp_path):
+    """Test that estimators sharing param_store do not overwrite each other."""
+    X_training, _ = load_gunpoint(split="train", return_X_y=True)
+
+    minirocket = MiniRocket(num_kernels=840, random_state=0, param_store=str(tmp_path))
+    X_transform = minirocket.fit_transform(X_training)
+
+    minirocket.clone().set_params(random_state=2).fit(X_training)
+    MiniRocket(num_kernels=840, random_state=3, param_store=str(tmp_path)).fit(
+        X_training
+    )
+
+    np.testing.assert_array_equal(
+        minirocket.transform(X_training).values, X_transform.values
+    )
@@ -16,6 +16,10 @@ New parallelization or iteration backends can be added easily as follows:
 
 __author__ = ["fkiraly"]
 
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+
 
 def parallelize(fun, iter, meta=None, backend=None, backend_params=None):
     """Parallelize loop over iter via backend.
@@ -87,6 +91,52 @@ backend_dict = {
 para_dict = {}
 
 
+@lru_cache(maxsize=None)
+def _available_cores():
+    """Return the number of cpu cores available to the current process.
+
+    Unlike ``os.cpu_count`` or ``multiprocessing.cpu_count``, this respects the cpu
+    affinity of the process where the platform supports it, e.g., cpusets of
+    containers on linux. The result is cached, as it is queried on hot paths.
+
+    Returns
+    -------
+    int
+        number of usable cpu cores, at least 1
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@contextmanager
+def _with_numba_threads(n_threads):
+    """Run the enclosed block with ``n_threads`` numba threads.
+
+    The thread count of numba is local to the calling thread, the previous value is
+    restored on exit. If it already equals ``n_threads``, it is left untouched.
+    ``n_threads`` is capped at ``numba.config.NUMBA_NUM_THREADS``, the size of the
+    numba thread pool, which ``set_num_threads`` cannot exceed.
+
+    Parameters
+    ----------
+    n_threads : int
+        number of numba threads to use, at least 1
+    """
+    from numba import config, get_num_threads, set_num_threads
+
+    n_threads = min(n_threads, config.NUMBA_NUM_THREADS)
+    prev_threads = get_num_threads()
+    if prev_threads == n_threads:
+        yield
+        return
+    set_num_threads(n_threads)
+    try:
+        yield
+    finally:
+        set_num_threads(prev_threads)
+
+
 def _parallelize_none(fun, iter, meta, backend, backend_params):
     """Execute loop via simple sequential list comprehension."""
     ret = [fun(x, meta=meta) for x in iter]